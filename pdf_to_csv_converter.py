@@ -38,48 +38,125 @@ Date: 2025‑08‑27
 """
 
 import argparse
-import csv
+import io
 import os
 import re
+import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple  # Compatibility with older Python versions
-
-
-def extract_text_from_pdf(pdf_path: Path) -> str:
-    """Run pdftotext on the given PDF and return the extracted text.
+from typing import Optional, List, Callable, Dict, Generator, Iterable, Iterator, Tuple  # Compatibility with older Python versions
+
+# Regular expressions are compiled once at import time rather than looked up in
+# the `re` module cache on every call.
+# Two or more whitespace characters separate a label from its value.
+_SPLIT_RE = re.compile(r"\s{2,}")
+# Translation table that cleans an amount in a single pass: it deletes every
+# whitespace character (including non-breaking space, used as a thousands
+# separator) and the dot thousands separator, and turns the decimal comma into
+# a period.  All Unicode whitespace lies below U+3001.
+_AMT_TRANS = {c: None for c in range(0x3001) if chr(c).isspace()}
+_AMT_TRANS.update({ord("."): None, ord(","): "."})
+# Labels that begin a statement line (after any layout indentation), matched
+# with a single regex probe on the unstripped line.  The partner name labels
+# start a new transaction; the others, like the amount labels below, are
+# dispatched via `_LABEL_FIELDS`.
+_LABEL_RE = re.compile(
+    r"\s*(Címzett neve|Megbízó neve|Értéknap|Közlemény|Megjegyzés|Partnerek közti egyedi azonosító)"
+)
+_NEW_TRANSACTION_LABELS = frozenset(("Címzett neve", "Megbízó neve"))
+# Credit and debit amount labels, which may appear anywhere on a line.  A
+# plain substring test is several times faster here than a regex search.
+_AMOUNT_LABELS = ("Jóváírás összege", "Terhelés összege")
+_AMOUNT_MARKER = " összege"
+# Hungarian value date, e.g. "2025.08.01." (the trailing dot is optional).
+_DATE_RE = re.compile(r"(\d{4})\.(\d{2})\.(\d{2})\.?")
+# Keyword rules used by `_classify_transaction` as (group name, pattern,
+# category), in priority order.  The "interest" rule has no fixed category;
+# its type depends on the sign of the amount.
+_CLASSIFIER_RULES: Tuple[Tuple[str, str, str], ...] = (
+    ("refund", r"refund|visszatérítés|visszautalás", "Refund"),
+    ("transfer", r"átvezetés|transfer", "Transfer"),
+    ("dividend", r"osztalék|dividend", "Investment - Dividend"),
+    ("gain", r"tőke[\s_-]*nyereség|capital gain|nyereség", "Investment - Capital Gain"),
+    ("loss", r"veszteség|loss", "Investment - Capital Loss"),
+    ("buy", r"\b(?:buy|purchase|vétel)\b", "Investment - Buy"),
+    ("sell", r"\b(?:sell|eladás)\b", "Investment - Sell"),
+    ("salary", r"/ref/salary|salary|munkabér", "Income"),
+    ("interest", r"kamat", ""),
+    (
+        "expense",
+        r"pos|kereskedői|bankkártya|kártya|díja|levonás|szocho|hitel|törlesztés|biztosítás|nyugd",
+        "Expense",
+    ),
+)
+# All rules fused into one alternation so a description is scanned once.
+_CLASSIFIER_RE = re.compile(
+    "|".join(f"(?P<{name}>{pat})" for name, pat, _ in _CLASSIFIER_RULES),
+    re.IGNORECASE,
+)
+_GROUP_TO_CATEGORY: Dict[str, str] = {name: cat for name, _, cat in _CLASSIFIER_RULES}
+_RULE_ORDER: List[str] = [name for name, _, _ in _CLASSIFIER_RULES]
+_RULE_RES: Dict[str, "re.Pattern[str]"] = {
+    name: re.compile(pat, re.IGNORECASE) for name, pat, _ in _CLASSIFIER_RULES
+}
+
+
+@lru_cache(maxsize=None)
+def _pdftotext_path() -> Optional[str]:
+    """Return the absolute path of the pdftotext executable, or None if missing."""
+    return shutil.which("pdftotext")
+
+
+def extract_lines_from_pdf(pdf_path: Path) -> Generator[str, None, None]:
+    """Run pdftotext on the given PDF and return an iterator over its lines.
 
     The function uses the "-layout" option to preserve column alignment which
-    helps when splitting fields separated by multiple spaces.  A temporary
-    file is created to hold the result.  If pdftotext fails, a RuntimeError
-    is raised.
+    helps when splitting fields separated by multiple spaces.  The text is
+    written to stdout ("-") and streamed line by line, so parsing overlaps
+    with extraction and the full text is never held in memory.  A missing
+    pdftotext is reported with a RuntimeError immediately.  The process itself
+    is only started once iteration begins, so an iterator that is never
+    consumed leaks nothing; if pdftotext exits with an error, the
+    RuntimeError is raised once its output is exhausted.
     """
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as tmp:
-        tmp_path = Path(tmp.name)
-    # Use pdftotext to extract with layout.  Write to temporary file.
+    executable = _pdftotext_path()
+    if executable is None:
+        raise RuntimeError(
+            "pdftotext command not found. Please install poppler-utils (pdftotext)."
+        )
+    return _iter_pdftotext_lines(executable, pdf_path)
+
+
+def _iter_pdftotext_lines(executable: str, pdf_path: Path) -> Generator[str, None, None]:
+    """Start pdftotext, yield its decoded lines, then check its exit status."""
+    # Keep this call eligible for CPython's os.posix_spawn() fast path, which
+    # avoids a full fork() of the interpreter for each PDF: the executable is
+    # given as a path containing a directory, close_fds is False (Python
+    # creates its descriptors non-inheritable anyway), and no preexec_fn,
+    # cwd, pass_fds or start_new_session may be passed.
     try:
-        subprocess.run(
-            ["pdftotext", "-layout", str(pdf_path), str(tmp_path)],
-            check=True,
-            stdout=subprocess.DEVNULL,
+        proc = subprocess.Popen(
+            [executable, "-layout", "-enc", "UTF-8", str(pdf_path), "-"],
+            stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL,
+            close_fds=False,
         )
     except FileNotFoundError:
         raise RuntimeError(
             "pdftotext command not found. Please install poppler-utils (pdftotext)."
         )
-    except subprocess.CalledProcessError as exc:
+    # Leaving the `with` block closes stdout and waits for the process, also
+    # when the generator is closed early.
+    with proc:
+        yield from io.TextIOWrapper(proc.stdout, encoding="utf-8", errors="replace")
+    if proc.returncode:
+        exc = subprocess.CalledProcessError(proc.returncode, proc.args)
         raise RuntimeError(f"pdftotext failed for {pdf_path}: {exc}") from exc
-    # Read the entire text and remove the temporary file.
-    with tmp_path.open("r", encoding="utf-8", errors="replace") as f:
-        text = f.read()
-    try:
-        tmp_path.unlink()
-    except OSError:
-        pass
-    return text
 
 
 def split_label_value(line: str) -> Tuple[str, str]:
@@ -94,99 +171,199 @@ def split_label_value(line: str) -> Tuple[str, str]:
     is returned as the label with an empty string as the value.
     """
     # Use Unicode aware whitespace splitting (\s includes NBSP and other spaces).
-    parts = re.split(r"\s{2,}", line.strip())
+    # The line is stripped once here; callers pass the raw line unstripped.
+    # The split consumes whole whitespace runs, so the parts need no further
+    # stripping.
+    stripped = line.strip()
+    parts = _SPLIT_RE.split(stripped)
     if len(parts) >= 2:
         # label is first part, value is the remainder rejoined in case there were
         # multiple large gaps.
         label = parts[0]
-        value = " ".join(parts[1:]).strip()
+        value = " ".join(parts[1:])
         return label, value
-    return line.strip(), ""
+    return stripped, ""
+
+
+class Transaction:
+    """A single parsed transaction; see the module docstring for the fields.
+
+    A slotted class rather than a dictionary keeps each record small and its
+    attribute access fast.  Fields that are absent from the statement are
+    left as empty strings.
+    """
+
+    __slots__ = ("date", "name", "amount", "reference", "note", "id")
+
+    def __init__(
+        self,
+        date: str = "",
+        name: str = "",
+        amount: str = "",
+        reference: str = "",
+        note: str = "",
+        id: str = "",
+    ) -> None:
+        self.date = date
+        self.name = name
+        self.amount = amount
+        self.reference = reference
+        self.note = note
+        self.id = id
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={getattr(self, k)!r}" for k in self.__slots__)
+        return f"Transaction({fields})"
+
+
+def _normalize_amount(value: str) -> str:
+    """Normalise an amount (debit or credit) to a plain decimal string.
+
+    Amounts can include spaces and comma decimal separators; negative numbers
+    for debits.  If the value cannot be parsed it is returned unchanged.
+    """
+    # Remove currency (HUF), then whitespace and thousands separators, and
+    # convert the comma decimal separator to a period.
+    amt_str = value.replace("HUF", "").replace("Ft", "").translate(_AMT_TRANS)
+    # Amounts normally have at most two decimals, so parse them as integer
+    # cents.  This is exact even for very large amounts, unlike a float.
+    negative = amt_str.startswith("-")
+    unsigned = amt_str[1:] if negative or amt_str.startswith("+") else amt_str
+    int_part, _, frac_part = unsigned.partition(".")
+    if (
+        (int_part or frac_part)
+        and (not int_part or int_part.isdecimal())
+        and (not frac_part or frac_part.isdecimal())
+        and len(frac_part) <= 2
+    ):
+        cents = int(int_part or "0") * 100 + int(frac_part.ljust(2, "0"))
+        sign = "-" if negative else ""
+        return f"{sign}{cents // 100}.{cents % 100:02d}"
+    # Anything else (e.g. more decimals): attempt to cast to float; if it
+    # fails leave as string.
+    try:
+        amount_value = float(amt_str)
+    except ValueError:
+        return value
+    # Format to preserve sign and decimal places consistently.
+    return f"{amount_value:.2f}"
+
+
+def _normalize_date(value: str) -> str:
+    """Normalise a value date (Értéknap) such as "2025.08.01." to "2025-08-01"."""
+    m = _DATE_RE.fullmatch(value)
+    if m:
+        return f"{m[1]}-{m[2]}-{m[3]}"
+    # Unusual formats: replace dots with hyphens after trimming the trailing dot.
+    date_str = value.strip().rstrip(".")
+    return date_str.replace(".", "-")
 
 
-def parse_statement_text(text: str) -> List[Dict[str, str]]:
-    """Parse MBH Netbank statement text into a list of transaction dictionaries.
+def _identity(value: str) -> str:
+    """Return the value unchanged (for labels stored verbatim)."""
+    return value
 
-    The parser scans through the text line by line, starting a new
+
+# Maps each label matched by `_LABEL_RE` within a transaction to the field it
+# fills and the function that normalises its value.
+_LABEL_FIELDS: Dict[str, Tuple[str, Callable[[str], str]]] = {
+    "Jóváírás összege": ("amount", _normalize_amount),
+    "Terhelés összege": ("amount", _normalize_amount),
+    "Értéknap": ("date", _normalize_date),
+    "Közlemény": ("reference", _identity),
+    "Megjegyzés": ("note", _identity),
+    "Partnerek közti egyedi azonosító": ("id", _identity),
+}
+
+
+def parse_statement_text(lines: Iterable[str]) -> Iterator[Transaction]:
+    """Parse MBH Netbank statement text, yielding one transaction at a time.
+
+    The parser consumes the lines one at a time (any iterable of strings,
+    such as the output of `extract_lines_from_pdf`), starting a new
     transaction whenever it encounters a "Címzett neve" or "Megbízó neve"
     label.  It collects certain fields within the transaction until the
-    next one starts.  At the end, any incomplete transaction still being
-    built is appended to the result list.
+    next one starts, at which point the finished transaction is yielded.
+    At the end, any incomplete transaction still being built is yielded
+    too.  Only the transaction being built is held in memory.
     """
-    lines = text.splitlines()
-    transactions: List[Dict[str, str]] = []
-    current: Optional[Dict[str, str]] = None
-    for raw_line in lines:
-        line = raw_line.strip()
-        if not line:
-            continue  # skip empty lines
+    current: Optional[Transaction] = None
+    for line in lines:
+        # Lines are not stripped up front: `_LABEL_RE` skips leading
+        # indentation itself, and blank lines simply match no label.  Only
+        # labelled lines are stripped, inside `split_label_value`.
+        m = _LABEL_RE.match(line)
+        label = m.group(1) if m else None
         # Identify the start of a new transaction by the presence of the
         # partner name labels.  Flush the previous transaction if necessary.
-        if line.startswith("Címzett neve") or line.startswith("Megbízó neve"):
+        if label in _NEW_TRANSACTION_LABELS:
             # When encountering a new transaction, finalize the previous one
-            if current:
-                transactions.append(current)
-            label, value = split_label_value(raw_line)
-            # Create a fresh transaction dictionary.
-            current = {
-                "name": value,
-                "date": "",
-                "amount": "",
-                "reference": "",
-                "note": "",
-                "id": "",
-            }
+            if current is not None:
+                yield current
+            _, value = split_label_value(line)
+            current = Transaction(name=value)
             continue
         # If no transaction has been started yet, ignore lines until one is.
         if current is None:
             continue
-        # Parse amount lines (debit or credit).  Amounts can include spaces
-        # and comma decimal separators; negative numbers for debits.
-        if "Jóváírás összege" in line or "Terhelés összege" in line:
-            label, value = split_label_value(raw_line)
-            # Remove currency (HUF) and spaces.
-            # Some statements use non-breaking space (\xa0) as a thousand separator.
-            amt_str = value.replace("HUF", "").replace("Ft", "")
-            # Replace various types of whitespace with nothing.
-            amt_str = re.sub(r"[\s\u00A0]+", "", amt_str)
-            # Remove thousands separators (either dot or narrow NBSP) and convert
-            # comma decimal separator to period.
-            amt_str = amt_str.replace(".", "").replace(",", ".")
-            # Attempt to cast to float; if it fails leave as string.
-            try:
-                amount_value = float(amt_str)
-                # Format to preserve sign and decimal places consistently.
-                current["amount"] = f"{amount_value:.2f}"
-            except ValueError:
-                current["amount"] = value
-            continue
-        # Parse value date.
-        if line.startswith("Értéknap"):
-            _, value = split_label_value(raw_line)
-            # Normalise date by replacing dots with hyphens and trimming trailing dot.
-            date_str = value.strip().rstrip(".")
-            date_str = date_str.replace(".", "-")
-            current["date"] = date_str
-            continue
-        # Parse comment/reference (Közlemény).
-        if line.startswith("Közlemény"):
-            _, value = split_label_value(raw_line)
-            current["reference"] = value
-            continue
-        # Parse note (Megjegyzés).
-        if line.startswith("Megjegyzés"):
-            _, value = split_label_value(raw_line)
-            current["note"] = value
-            continue
-        # Parse partner ID (Partnerek közti egyedi azonosító).
-        if line.startswith("Partnerek közti egyedi azonosító"):
-            _, value = split_label_value(raw_line)
-            current["id"] = value
-            continue
-    # At the end of parsing, append the final transaction if present.
-    if current:
-        transactions.append(current)
-    return transactions
+        # Amount labels may appear anywhere on the line and take precedence
+        # over the left‑anchored labels.  Both share the " összege" suffix, so
+        # a single substring scan rules out almost every other line.
+        if _AMOUNT_MARKER in line:
+            for amount_label in _AMOUNT_LABELS:
+                if amount_label in line:
+                    label = amount_label
+                    break
+        if label is not None:
+            field, transform = _LABEL_FIELDS[label]
+            _, value = split_label_value(line)
+            setattr(current, field, transform(value))
+    # At the end of parsing, yield the final transaction if present.
+    if current is not None:
+        yield current
+
+
+def _match_rule(desc: str) -> Optional[str]:
+    """Return the name of the highest‑priority classifier rule matching `desc`.
+
+    The fused `_CLASSIFIER_RE` finds the leftmost keyword in a single scan.
+    Because an alternation prefers the leftmost match rather than the first
+    rule, any higher‑priority rules are then checked on the remainder of the
+    description; this only happens when a keyword was found at all.  Returns
+    None when no rule matches.
+    """
+    m = _CLASSIFIER_RE.search(desc)
+    if m is None:
+        return None
+    name = m.lastgroup
+    # A higher‑priority rule cannot match at or before m.start(), otherwise
+    # the alternation would have reported it instead.
+    for higher in _RULE_ORDER[: _RULE_ORDER.index(name)]:
+        if _RULE_RES[higher].search(desc, m.start() + 1):
+            return higher
+    return name
+
+
+# Categories that depend only on the sign of the amount (1, 0 or -1): for
+# interest, and as the default when no rule matches.  A zero amount is
+# categorised as Transfer as a sensible default.
+_INTEREST_BY_SIGN: Dict[int, str] = {1: "Income", 0: "Expense", -1: "Expense"}
+_DEFAULT_BY_SIGN: Dict[int, str] = {1: "Income", 0: "Transfer", -1: "Expense"}
+
+
+@lru_cache(maxsize=4096)
+def _classify_by_desc(desc: str) -> Optional[str]:
+    """Return the category decided by the description alone.
+
+    Returns None when no rule matches, and an empty string when the matching
+    rule (interest) depends on the sign of the amount.  Statements repeat the
+    same descriptions (salary, recurring bills, regular merchants), so the
+    result is memoised.
+    """
+    rule = _match_rule(desc)
+    if rule is None:
+        return None
+    return _GROUP_TO_CATEGORY[rule]
 
 
 def _classify_transaction(description: str, amount_str: str) -> str:
@@ -211,49 +388,66 @@ def _classify_transaction(description: str, amount_str: str) -> str:
     If no specific rule applies, the function falls back to returning
     "Income" for positive amounts and "Expense" for negative amounts.
     """
-    desc = (description or "").lower()
-    # Attempt to parse the amount to determine its sign.  If parsing fails
-    # default to zero.
+    category = _classify_by_desc(description or "")
+    if category:
+        return category
+    # Only the remaining cases depend on the amount.  Attempt to parse the
+    # amount to determine its sign.  If parsing fails default to zero.
     amount = 0.0
     try:
         amount = float(amount_str)
     except Exception:
         pass
-    # Refund keywords
-    if re.search(r"refund|visszatérítés|visszautalás", desc):
-        return "Refund"
-    # Transfers between accounts
-    if re.search(r"átvezetés|transfer", desc):
-        return "Transfer"
-    # Investment dividends
-    if re.search(r"osztalék|dividend", desc):
-        return "Investment - Dividend"
-    # Capital gains and losses
-    if re.search(r"tőke[\s_-]*nyereség|capital gain|nyereség", desc):
-        return "Investment - Capital Gain"
-    if re.search(r"veszteség|loss", desc):
-        return "Investment - Capital Loss"
-    # Investment buys and sells
-    if re.search(r"\b(buy|purchase|vétel)\b", desc):
-        return "Investment - Buy"
-    if re.search(r"\b(sell|eladás)\b", desc):
-        return "Investment - Sell"
-    # Salary/income
-    if re.search(r"/ref/salary|salary|munkabér", desc):
-        return "Income"
-    # Interest: classify based on sign
-    if re.search(r"kamat", desc):
-        return "Income" if amount > 0 else "Expense"
-    # POS or card purchases are expenses
-    if re.search(r"pos|kereskedői|bankkártya|kártya|díja|levonás|szocho|hitel|törlesztés|biztosítás|nyugd", desc):
-        return "Expense"
+    sign = (amount > 0) - (amount < 0)
+    if category == "":
+        # Interest: classify based on sign
+        return _INTEREST_BY_SIGN[sign]
     # Default based on amount sign
-    if amount > 0:
-        return "Income"
-    if amount < 0:
-        return "Expense"
-    # If zero, categorise as Transfer as a sensible default
-    return "Transfer"
+    return _DEFAULT_BY_SIGN[sign]
+
+
+# Header line of the CSV output, and the characters that force a field to be
+# quoted.  Rows are terminated with "\r\n", as csv.writer's default (excel)
+# dialect does.
+_CSV_HEADER = b"date,amount,type,description\r\n"
+_CSV_QUOTE_RE = re.compile(r'[",\r\n]')
+
+
+def _csv_quote(field: str) -> str:
+    """Quote a CSV field only when needed, matching csv.writer's output."""
+    if _CSV_QUOTE_RE.search(field):
+        return '"' + field.replace('"', '""') + '"'
+    return field
+
+
+def _csv_line(rec: Transaction) -> bytes:
+    """Build the encoded CSV line (date, amount, type, description) for `rec`."""
+    # Combine the original counterparty name with the reference/note.  The
+    # previous "name" column is prepended to the description so that
+    # details about the payee/payer are retained.  If no name is
+    # available, the description consists solely of the reference or
+    # note.
+    base_desc = (rec.reference or rec.note).strip()
+    name_part = rec.name.strip()
+    if name_part and base_desc:
+        description = f"{name_part} - {base_desc}"
+    elif name_part:
+        description = name_part
+    else:
+        description = base_desc
+    # The type is always one of the fixed categories, which never need quoting.
+    txn_type = _classify_transaction(base_desc, rec.amount)
+    line = f"{_csv_quote(rec.date)},{_csv_quote(rec.amount)},{txn_type},{_csv_quote(description)}\r\n"
+    return line.encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _default_file_mode() -> int:
+    """Return the permission bits a newly created file gets under the umask."""
+    # The umask can only be read by setting it, so restore it immediately.
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
 
 
 def convert_pdf_to_csv(pdf_path: Path, csv_path: Path) -> None:
@@ -268,37 +462,46 @@ def convert_pdf_to_csv(pdf_path: Path, csv_path: Path) -> None:
     The `description` field is derived from the original reference; if
     the reference is missing then the note is used instead.  The
     classification rules are implemented in `_classify_transaction`.
+
+    Extraction, parsing and writing are streamed, so each transaction is
+    written as soon as it is parsed.  The output goes to a temporary file
+    that replaces `csv_path` only on success; if pdftotext fails part way
+    through, the temporary file is removed and any existing CSV is left
+    untouched.  Failures to write the CSV are also raised as RuntimeError.
     """
-    text = extract_text_from_pdf(pdf_path)
-    records = parse_statement_text(text)
-    # Write to CSV with UTF‑8 encoding and newline='' to avoid blank lines on Windows.
-    with csv_path.open("w", encoding="utf-8", newline="") as f:
-        fieldnames = ["date", "amount", "type", "description"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for rec in records:
-            # Combine the original counterparty name with the reference/note.  The
-            # previous "name" column is prepended to the description so that
-            # details about the payee/payer are retained.  If no name is
-            # available, the description consists solely of the reference or
-            # note.
-            base_desc = (rec.get("reference", "") or rec.get("note", "")).strip()
-            name_part = rec.get("name", "").strip()
-            if name_part and base_desc:
-                description = f"{name_part} - {base_desc}"
-            elif name_part:
-                description = name_part
-            else:
-                description = base_desc
-            txn_type = _classify_transaction(base_desc, rec.get("amount", "0"))
-            writer.writerow(
-                {
-                    "date": rec.get("date", ""),
-                    "amount": rec.get("amount", ""),
-                    "type": txn_type,
-                    "description": description,
-                }
-            )
+    # Stream into a uniquely named sibling temporary file and only move it
+    # over `csv_path` once everything has been written, so an existing CSV
+    # survives a failed or interrupted conversion.  A unique name matters
+    # because "a.pdf" and "a.PDF" both map to "a.csv" and may be converted by
+    # two workers at once.
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            dir=csv_path.parent, prefix=csv_path.name, suffix=".tmp"
+        )
+    except OSError as exc:
+        raise RuntimeError(f"cannot write {csv_path}: {exc.strerror}") from exc
+    tmp_path = Path(tmp_name)
+    try:
+        # mkstemp creates the file readable by the owner only; give it the
+        # permissions a regular new file would get.
+        os.chmod(tmp_path, _default_file_mode())
+        # The schema is fixed and every value is already a string, so lines
+        # are formatted and UTF‑8 encoded directly instead of going through
+        # the csv module, and written to a buffered binary file.  pdftotext is
+        # only started once the temporary file is open, and closing the line
+        # generator reaps it even if writing fails part way through.
+        with os.fdopen(fd, "wb") as f, closing(extract_lines_from_pdf(pdf_path)) as lines:
+            f.write(_CSV_HEADER)
+            f.writelines(_csv_line(rec) for rec in parse_statement_text(lines))
+        os.replace(tmp_path, csv_path)
+    except BaseException as exc:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        if isinstance(exc, OSError):
+            raise RuntimeError(f"cannot write {csv_path}: {exc.strerror}") from exc
+        raise
 
 
 def default_downloads_path() -> Path:
@@ -308,6 +511,21 @@ def default_downloads_path() -> Path:
     return home / "Downloads"
 
 
+def _convert_one(job: Tuple[Path, Path]) -> Tuple[str, str, Optional[str]]:
+    """Convert a single (pdf_path, csv_path) job inside a worker process.
+
+    Errors are not printed here; instead a (pdf name, csv name, error) tuple
+    is returned so that the parent process can report results in order
+    without interleaving output from several workers.
+    """
+    pdf_path, csv_path = job
+    try:
+        convert_pdf_to_csv(pdf_path, csv_path)
+    except RuntimeError as exc:
+        return pdf_path.name, csv_path.name, str(exc)
+    return pdf_path.name, csv_path.name, None
+
+
 def main(args: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(
         description="Convert MBH (Takarék) PDF account statements into CSV files."
@@ -319,7 +537,16 @@ def main(args: Optional[List[str]] = None) -> int:
         default=None,
         help="Directory to scan for PDF files (defaults to your Downloads folder)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of PDFs to convert in parallel (defaults to the CPU count)",
+    )
     ns = parser.parse_args(args)
+    if ns.jobs is not None and ns.jobs < 1:
+        parser.error("--jobs must be at least 1")
     # Determine whether the provided argument is a file or a directory.  If no
     # argument is given, default to the user's Downloads folder.  If a file
     # ending in .pdf is specified, convert just that file.  Otherwise, treat
@@ -338,17 +565,39 @@ def main(args: Optional[List[str]] = None) -> int:
     if not target.is_dir():
         print(f"Error: {target} is not a valid directory or PDF file.", file=sys.stderr)
         return 1
-    pdf_files = [p for p in target.iterdir() if p.suffix.lower() == ".pdf"]
+    # os.scandir() reports the entry type from the directory listing itself,
+    # so only matching names are turned into Path objects.
+    with os.scandir(target) as entries:
+        pdf_files = [
+            Path(entry.path)
+            for entry in entries
+            if os.path.splitext(entry.name)[1].lower() == ".pdf" and entry.is_file()
+        ]
     if not pdf_files:
         print(f"No PDF files found in {target}.")
         return 0
-    for pdf_path in pdf_files:
-        csv_path = pdf_path.with_suffix(".csv")
-        try:
-            convert_pdf_to_csv(pdf_path, csv_path)
-            print(f"Converted {pdf_path.name} -> {csv_path.name}")
-        except RuntimeError as exc:
-            print(f"Failed to convert {pdf_path.name}: {exc}", file=sys.stderr)
+    # Each PDF is independent, so convert them in a pool of worker processes.
+    # Within a worker, pdftotext already runs concurrently with the parser
+    # because its output is streamed through a pipe (see
+    # `extract_lines_from_pdf`), so extraction and parsing overlap without a
+    # separate producer stage.  The requested job count is clamped to the
+    # number of CPUs available.
+    cpu_count = os.cpu_count() or 1
+    jobs = ns.jobs if ns.jobs is not None else cpu_count
+    if jobs > cpu_count:
+        print(
+            f"Warning: --jobs {jobs} exceeds the CPU count; using {cpu_count}.",
+            file=sys.stderr,
+        )
+        jobs = cpu_count
+    jobs = min(jobs, len(pdf_files))
+    conversions = [(p, p.with_suffix(".csv")) for p in pdf_files]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for pdf_name, csv_name, err in executor.map(_convert_one, conversions, chunksize=1):
+            if err is None:
+                print(f"Converted {pdf_name} -> {csv_name}")
+            else:
+                print(f"Failed to convert {pdf_name}: {err}", file=sys.stderr)
     return 0
 
 